@@ -6,7 +6,13 @@ e.g. from config import Config, generate_config
 
 from typing import TypedDict, Literal, Any
 from pydantic import BaseModel, ConfigDict, PositiveInt, model_validator
+import functools
+import hashlib
+import json
+import os
+import tempfile
 import tomllib
+from pathlib import Path
 
 # Define the valid key options
 KeyOptions = Literal[
@@ -246,7 +252,7 @@ class Config(BaseModel):
     Currently enforces MVP limitations:
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
     Show: ShowSettings
     AI: AISettings
     Mode: ModeSettings
@@ -255,46 +261,59 @@ class Config(BaseModel):
     Health_Check: HealthCheckSettings
 
     @model_validator(mode="after")
-    def validate_mvp_limits(self):
+    def validate_config(self):
+        # All cross-field checks run in one validator pass; every failure is reported.
+        errors: list[str] = []
+
         # Enforce MVP limitations
         if self.Show["Language"] != "en-US":
-            raise ValueError("Only 'en-US' language is supported in MVP.")
+            errors.append("Only 'en-US' language is supported in MVP.")
         if self.Show["Type"] != "mono-scene":
-            raise ValueError("Only 'mono-scene' show type is supported in MVP.")
+            errors.append("Only 'mono-scene' show type is supported in MVP.")
         if self.Show["Actors_count"] != 1:
-            raise ValueError("Only 1 actor is supported in MVP.")
+            errors.append("Only 1 actor is supported in MVP.")
         if self.Show["Avatar_count"] != 1:
-            raise ValueError("Only 1 avatar is supported in MVP.")
-        return self
+            errors.append("Only 1 avatar is supported in MVP.")
 
-    @model_validator(mode="after")
-    def validate_avatars_count(self):
+        # Avatar counts
         if len(self.Buttons["Avatars"]) != self.Show["Avatar_count"]:
-            raise ValueError("Buttons.Avatar count must match Show.Avatar_count.")
+            errors.append("Buttons.Avatar count must match Show.Avatar_count.")
         if len(self.AI["Avatars"]) != self.Show["Avatar_count"]:
-            raise ValueError("AI.Avatar count must match Show.Avatar_count.")
-        return self
+            errors.append("AI.Avatar count must match Show.Avatar_count.")
 
-    @model_validator(mode="after")
-    def validate_ethic_mode(self):
+        # Ethic mode
         if self.Mode["Ethic"]:
             if self.Show["Show_rating"] not in ["g", "pg", "pg-13"]:
-                raise ValueError("In Ethic mode, Show_rating must be g, pg, or pg-13.")
+                errors.append("In Ethic mode, Show_rating must be g, pg, or pg-13.")
             if self.Show["Disclaimer"] not in ["short", "full"]:
-                raise ValueError("In Ethic mode, Disclaimer must be short or full.")
+                errors.append("In Ethic mode, Disclaimer must be short or full.")
             if self.Mode["Debug"]:
-                raise ValueError(
+                errors.append(
                     "Ethic mode and Debug mode cannot be enabled simultaneously."
                 )
             if self.Network["Use_tls"] is not True:
-                raise ValueError("TLS must be enabled in Ethics mode.")
+                errors.append("TLS must be enabled in Ethics mode.")
+
+        if errors:
+            raise ValueError(" ".join(errors))
         return self
 
 
+# Validated configs keyed by absolute path, along with the (mtime_ns, size) of the
+# file they were loaded from so an edited file is re-read.
+_CONFIG_CACHE: dict[str, tuple[tuple[int, int], Config]] = {}
+
+# Suffix of the marker file holding the SHA-256 of a config that passed validation.
+TRUSTED_MARKER_SUFFIX = ".sha256.ok"
+
+
 def generate_config(configPath: str) -> Config:
     """
     Generates a Config object from a TOML configuration file.
     Any raised validation errors will be propagated to the caller.
+    Results are cached per file and reused until the file's modification time or size
+    changes. Each call returns its own deep copy, so changes made by one caller (the
+    sections are plain dicts) never reach the cache or other callers.
 
     :param configPath: Path to the configuration file
     :type configPath: str
@@ -302,9 +321,142 @@ def generate_config(configPath: str) -> Config:
     :rtype: Config
     """
 
-    unverified_config: dict[str, Any]
+    path = os.path.abspath(configPath)
+    stat_result = os.stat(path)
+    signature = (stat_result.st_mtime_ns, stat_result.st_size)
 
-    with open(configPath, mode="rb") as fp:
-        unverified_config = tomllib.load(fp)
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1].model_copy(deep=True)
+
+    with open(path, mode="rb") as fp:
+        raw_config = fp.read()
 
-    return Config(**unverified_config)
+    unverified_config: dict[str, Any] = tomllib.loads(raw_config.decode())
+
+    config = Config.model_validate(unverified_config)
+    _CONFIG_CACHE[path] = (signature, config)
+    return config.model_copy(deep=True)
+
+
+def clear_config_cache() -> None:
+    """
+    Drops all Config objects cached by generate_config, forcing the next call to re-read
+    and re-validate the file (e.g. from a SIGHUP handler).
+    """
+
+    _CONFIG_CACHE.clear()
+
+
+@functools.cache
+def _config_fingerprint() -> bytes:
+    """
+    Identifies the current Config schema for trusted markers by hashing this module's
+    source, so any change to the fields or validators invalidates existing markers.
+
+    :return: Fingerprint of the Config schema
+    :rtype: bytes
+    """
+
+    return hashlib.sha256(Path(__file__).read_bytes()).digest()
+
+
+def _unchanged_by_validation(unverified_config: dict[str, Any], config: Config) -> bool:
+    """
+    Checks that validation kept the parsed TOML exactly as-is, so Config.model_construct
+    on the same data yields the same Config. Lax mode coerces values (e.g.
+    Debug = "false" becomes False), and such files must not take the trusted path.
+    JSON encoding keeps 1, True and "1" apart, unlike comparing the dicts with ==.
+
+    :param unverified_config: Parsed TOML that was validated
+    :type unverified_config: dict[str, Any]
+    :param config: Result of validating unverified_config
+    :type config: Config
+    :return: True if validation changed nothing
+    :rtype: bool
+    """
+
+    def encode(data: dict[str, Any]) -> str:
+        return json.dumps(data, sort_keys=True, default=repr)
+
+    return encode(unverified_config) == encode(config.model_dump())
+
+
+def _write_trusted_marker(marker_path: str, digest: str) -> None:
+    """
+    Atomically writes the digest to the marker file, so processes loading the same
+    config concurrently never read a partially written marker.
+
+    :param marker_path: Path of the marker file
+    :type marker_path: str
+    :param digest: Hex digest to record
+    :type digest: str
+    :raises OSError: If the marker cannot be written
+    """
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(marker_path)),
+        prefix=os.path.basename(marker_path) + ".",
+        suffix=".tmp",
+    )
+    try:
+        with os.fdopen(fd, mode="w", encoding="utf-8") as fp:
+            fp.write(digest)
+        os.chmod(tmp_path, 0o644)  # mkstemp creates 0600; other components read it.
+        os.replace(tmp_path, marker_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def generate_config_trusted(configPath: str) -> Config:
+    """
+    Generates a Config object from a TOML configuration file from a trusted source.
+    The first load runs full validation and records a SHA-256 of this module's source and
+    the file in a marker file next to it (configPath + TRUSTED_MARKER_SUFFIX). Later loads
+    of byte-identical content with unchanged config code skip validation via
+    Config.model_construct. Files whose values validation has to coerce (e.g. a quoted
+    "false" for a bool) never get a marker, so they are validated on every load.
+
+    Safety contract: only use this for files that come from an already validated source
+    (e.g. checked in CI before deployment). Anyone who can write both the file and its
+    marker bypasses validation. Use generate_config for untrusted input.
+
+    :param configPath: Path to the configuration file
+    :type configPath: str
+    :return: Config object for the AI Improv Toolkit
+    :rtype: Config
+    :raises OSError: If the config file cannot be read
+    """
+
+    with open(configPath, mode="rb") as fp:
+        raw_config = fp.read()
+
+    digest = hashlib.sha256(_config_fingerprint() + raw_config).hexdigest()
+    marker_path = configPath + TRUSTED_MARKER_SUFFIX
+    unverified_config: dict[str, Any] = tomllib.loads(raw_config.decode())
+
+    trusted_digest = ""
+    try:
+        with open(marker_path, encoding="utf-8") as fp:
+            trusted_digest = fp.read().strip()
+    except (OSError, UnicodeDecodeError):
+        pass  # Missing or unreadable marker: validate below and rewrite it.
+
+    if trusted_digest == digest:
+        return Config.model_construct(**unverified_config)
+
+    config = Config.model_validate(unverified_config)
+    if not _unchanged_by_validation(unverified_config, config):
+        return config
+
+    try:
+        _write_trusted_marker(marker_path, digest)
+    except OSError:
+        # The marker is only an optimization; without it the next load validates again.
+        # Config usually lives in a directory the service cannot write to.
+        pass
+    return config
@@ -0,0 +1,173 @@
+"""
+Tests for config loading: the per-file cache of generate_config and the marker-based
+trusted path of generate_config_trusted.
+
+Run from code/sharedCode: uv run --with pytest pytest
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+import config
+from config import (
+    TRUSTED_MARKER_SUFFIX,
+    Config,
+    clear_config_cache,
+    generate_config,
+    generate_config_trusted,
+)
+
+GOOD_CONFIG = Path(__file__).parent / "good_config.toml"
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+@pytest.fixture
+def config_path(tmp_path: Path) -> Path:
+    path = tmp_path / "config.toml"
+    shutil.copyfile(GOOD_CONFIG, path)
+    return path
+
+
+@pytest.fixture
+def validate_calls(monkeypatch: pytest.MonkeyPatch) -> list[Any]:
+    """
+    Records every full validation run by the loaders.
+    """
+
+    calls: list[Any] = []
+    original = Config.model_validate
+
+    def recording(obj: Any, *args: Any, **kwargs: Any) -> Config:
+        calls.append(obj)
+        return original(obj, *args, **kwargs)
+
+    monkeypatch.setattr(Config, "model_validate", recording)
+    return calls
+
+
+def marker_of(path: Path) -> Path:
+    return Path(str(path) + TRUSTED_MARKER_SUFFIX)
+
+
+def rename_show(path: Path, name: str) -> None:
+    path.write_text(path.read_text().replace('Name = "Show Name"', f'Name = "{name}"'))
+
+
+def test_cache_hit_returns_stored_config(config_path: Path, validate_calls: list):
+    first = generate_config(str(config_path))
+    second = generate_config(str(config_path))
+
+    assert len(validate_calls) == 1
+    assert second == first
+
+
+def test_cache_hit_is_isolated_from_caller_changes(config_path: Path):
+    first = generate_config(str(config_path))
+    first.Show["Language"] = "fr-FR"  # type: ignore[typeddict-item]
+
+    assert generate_config(str(config_path)).Show["Language"] == "en-US"
+
+
+def test_edited_file_is_revalidated(config_path: Path, validate_calls: list):
+    generate_config(str(config_path))
+    rename_show(config_path, "Edited Show")
+
+    assert generate_config(str(config_path)).Show["Name"] == "Edited Show"
+    assert len(validate_calls) == 2
+
+
+def test_touched_file_is_revalidated(config_path: Path, validate_calls: list):
+    generate_config(str(config_path))
+    st = os.stat(config_path)
+    os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    generate_config(str(config_path))
+    assert len(validate_calls) == 2
+
+
+def test_clear_config_cache_forces_reload(config_path: Path, validate_calls: list):
+    generate_config(str(config_path))
+    clear_config_cache()
+    generate_config(str(config_path))
+
+    assert len(validate_calls) == 2
+
+
+def test_trusted_load_writes_marker_then_skips_validation(
+    config_path: Path, validate_calls: list
+):
+    first = generate_config_trusted(str(config_path))
+    assert marker_of(config_path).is_file()
+    assert len(validate_calls) == 1
+
+    second = generate_config_trusted(str(config_path))
+    assert len(validate_calls) == 1  # model_construct path
+    assert second == first
+
+
+def test_trusted_changed_file_revalidates_and_rewrites_marker(
+    config_path: Path, validate_calls: list
+):
+    generate_config_trusted(str(config_path))
+    old_marker = marker_of(config_path).read_text()
+    rename_show(config_path, "Edited Show")
+
+    assert generate_config_trusted(str(config_path)).Show["Name"] == "Edited Show"
+    assert len(validate_calls) == 2
+    assert marker_of(config_path).read_text() != old_marker
+
+
+def test_trusted_invalid_file_raises_without_marker(config_path: Path):
+    config_path.write_text(
+        config_path.read_text().replace("Actors_count = 1", "Actors_count = 2")
+    )
+
+    with pytest.raises(ValidationError):
+        generate_config_trusted(str(config_path))
+    assert not marker_of(config_path).exists()
+
+
+def test_trusted_coerced_values_are_never_constructed_raw(
+    config_path: Path, validate_calls: list
+):
+    config_path.write_text(
+        config_path.read_text()
+        .replace("Debug = false", 'Debug = "false"')
+        .replace("Actors_count = 1", 'Actors_count = "1"')
+    )
+
+    first = generate_config_trusted(str(config_path))
+    second = generate_config_trusted(str(config_path))
+
+    assert second == first
+    assert second.Mode["Debug"] is False
+    assert not marker_of(config_path).exists()
+    assert len(validate_calls) == 2
+
+
+def test_trusted_unreadable_marker_is_a_miss(config_path: Path, validate_calls: list):
+    marker_of(config_path).mkdir()
+
+    generate_config_trusted(str(config_path))
+    assert len(validate_calls) == 1
+
+
+def test_trusted_marker_from_other_config_code_is_a_miss(
+    config_path: Path, validate_calls: list, monkeypatch: pytest.MonkeyPatch
+):
+    generate_config_trusted(str(config_path))
+
+    monkeypatch.setattr(config, "_config_fingerprint", lambda: b"edited config.py")
+    generate_config_trusted(str(config_path))
+    assert len(validate_calls) == 2